@@ -46,7 +46,7 @@ _MAPPING = {
     "timer": {"siid": 10, "piid": 3},
 }
 
-_MAPPINGS = {model: _MAPPING for model in SUPPORTED_MODELS}
+_MAPPINGS = dict.fromkeys(SUPPORTED_MODELS, _MAPPING)
 
 
 CLEANING_STAGES = [
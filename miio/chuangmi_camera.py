@@ -1,7 +1,6 @@
 """Xiaomi Chuangmi camera (chuangmi.camera.ipc009, ipc013, ipc019, 038a2) support."""
 
 import enum
-import ipaddress
 import logging
 import socket
 from typing import Any, Dict
@@ -64,8 +63,8 @@ class NASVideoRetentionTime(enum.IntEnum):
     Year = 31104000
 
 
-CONST_HIGH_SENSITIVITY = [MotionDetectionSensitivity.High] * 32
-CONST_LOW_SENSITIVITY = [MotionDetectionSensitivity.Low] * 32
+CONST_HIGH_SENSITIVITY = [int(MotionDetectionSensitivity.High)] * 32
+CONST_LOW_SENSITIVITY = [int(MotionDetectionSensitivity.Low)] * 32
 
 SUPPORTED_MODELS = [
     "chuangmi.camera.ipc009",
@@ -386,20 +385,25 @@ class ChuangmiCamera(Device):
             "video_retention_time": video_retention_time,
         }
 
-        share = urlparse(share)
-        if share.scheme == "smb":
-            ip = socket.gethostbyname(share.hostname)
-            reversed_ip = ".".join(reversed(ip.split(".")))
-            addr = int(ipaddress.ip_address(reversed_ip))
+        if share:
+            url = urlparse(share)
+            if url.scheme != "smb":
+                raise ValueError("Unsupported share scheme: %s" % url.scheme)
+            if not url.hostname:
+                raise ValueError("Share URL has no hostname")
+
+            ip = socket.gethostbyname(url.hostname)
+            # the device expects the address as a little-endian integer
+            addr = int.from_bytes(socket.inet_aton(ip), "little")
 
             params["share"] = {
                 "type": 1,
-                "name": share.hostname,
+                "name": url.hostname,
                 "addr": addr,
-                "dir": share.path.lstrip("/"),
+                "dir": url.path.lstrip("/"),
                 "group": "WORKGROUP",
-                "user": share.username,
-                "pass": share.password,
+                "user": url.username,
+                "pass": url.password,
             }
 
         return self.send("nas_set_config", params)
@@ -58,15 +58,16 @@ class ExceptionHandlerGroup(click.Group):
 
 class EnumType(click.Choice):
     def __init__(self, enumcls, casesensitive=False):
-        choices = enumcls.__members__
+        members = enumcls.__members__
 
         if not casesensitive:
-            choices = (_.lower() for _ in choices)
+            members = {name.lower(): member for name, member in members.items()}
 
         self._enumcls = enumcls
         self._casesensitive = casesensitive
+        self._members = dict(members)
 
-        super().__init__(list(sorted(set(choices))))
+        super().__init__(list(sorted(self._members)))
 
     def convert(self, value, param, ctx):
         if not self._casesensitive:
@@ -74,10 +75,7 @@ class EnumType(click.Choice):
 
         value = super().convert(value, param, ctx)
 
-        if not self._casesensitive:
-            return next(_ for _ in self._enumcls if _.name.lower() == value.lower())
-        else:
-            return next(_ for _ in self._enumcls if _.name == value)
+        return self._members[value]
 
     def get_metavar(self, param):
         word = self._enumcls.__name__
@@ -29,7 +29,7 @@ _MAPPING = {
 }
 
 SUPPORTED_MODELS = ["deerma.humidifier.jsqs", "deerma.humidifier.jsq5"]
-MIOT_MAPPING = {model: _MAPPING for model in SUPPORTED_MODELS}
+MIOT_MAPPING = dict.fromkeys(SUPPORTED_MODELS, _MAPPING)
 
 
 class OperationMode(enum.Enum):
@@ -45,7 +45,7 @@ MAPPING = {
     "reset_filter_life_level": {"siid": 11, "aiid": 1},
 }
 
-MIOT_MAPPING = {model: MAPPING for model in SUPPORTED_MODELS}
+MIOT_MAPPING = dict.fromkeys(SUPPORTED_MODELS, MAPPING)
 
 ERROR_CODES = {
     0: "No error",
@@ -176,10 +176,20 @@ class MiotDevice(Device):
 
     def set_property(self, property_key: str, value):
         """Sets property value using the existing mapping."""
+        return self.set_properties({property_key: value})
+
+    def set_properties(self, properties: Dict[str, Any]):
+        """Sets multiple property values using a single request.
+
+        :param properties: Property values keyed by their name in the mapping.
+        """
         mapping = self._get_mapping()
         return self.send(
             "set_properties",
-            [{"did": property_key, **mapping[property_key], "value": value}],
+            [
+                {"did": key, **mapping[key], "value": value}
+                for key, value in properties.items()
+            ],
         )
 
     def _get_mapping(self) -> MiotMapping:
@@ -1,4 +1,14 @@
-from miio.click_common import validate_ip, validate_token
+from enum import Enum
+
+import click
+import pytest
+
+from miio.click_common import EnumType, validate_ip, validate_token
+
+
+class DummyEnum(Enum):
+    First = 1
+    SecondValue = 2
 
 
 def test_validate_token_empty():
@@ -7,3 +17,21 @@ def test_validate_token_empty():
 
 def test_validate_ip_empty():
     assert validate_ip(None, None, None) is None
+
+
+def test_enumtype_convert():
+    enum_type = EnumType(DummyEnum)
+    assert list(enum_type.choices) == ["first", "secondvalue"]
+    assert enum_type.convert("SecondValue", None, None) is DummyEnum.SecondValue
+    assert enum_type.convert("first", None, None) is DummyEnum.First
+
+    with pytest.raises(click.BadParameter):
+        enum_type.convert("third", None, None)
+
+
+def test_enumtype_convert_casesensitive():
+    enum_type = EnumType(DummyEnum, casesensitive=True)
+    assert enum_type.convert("First", None, None) is DummyEnum.First
+
+    with pytest.raises(click.BadParameter):
+        enum_type.convert("first", None, None)
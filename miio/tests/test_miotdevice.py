@@ -213,3 +213,25 @@ def test_get_properties_for_mapping_readables(mocker, dev, props, included_in_re
                 )
             except AssertionError as ex:
                 raise AssertionError("Tried to read unreadable property") from ex
+
+
+def test_set_properties(dev):
+    dev._mappings["test.model"] = {
+        "first": {"siid": 1, "piid": 1},
+        "second": {"siid": 2, "piid": 3},
+    }
+
+    dev.set_properties({"first": True, "second": 5})
+    dev.send.assert_called_with(
+        "set_properties",
+        [
+            {"did": "first", "siid": 1, "piid": 1, "value": True},
+            {"did": "second", "siid": 2, "piid": 3, "value": 5},
+        ],
+    )
+
+    dev.set_property("second", 1)
+    dev.send.assert_called_with(
+        "set_properties",
+        [{"did": "second", "siid": 2, "piid": 3, "value": 1}],
+    )